@@ -10,14 +10,82 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import pandas as pd
-import math
+import numpy as np
 from dataclasses import dataclass
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from collections import namedtuple
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
 import os
+import sys
+import tempfile
+import threading
+
+try:
+    import orjson
+except ImportError:  # orjson kurulu değilse standart json kullanılır
+    orjson = None
+
+# PDF tablolarında sabit sütun genişlikleri (reportlab genişlik ölçmez)
+LING_COL_WIDTHS = [60] * 6
+# μ/ν hücresi Helvetica 10'da ~78pt: 85pt - 2x3pt dolgu sığar (toplam 451pt = A4 çerçevesi)
+PFS_COL_WIDTHS = [26] + [85] * 5
+WEIGHT_COL_WIDTHS = [60] * 2
+RESULT_COL_WIDTHS = [60, 90, 90, 90]
+
+# Ağır modüller (matplotlib, reportlab, python-docx) açılışı yavaşlatmasın
+# diye ilk kullanımda yüklenir; aşağıdaki adlar o zamana kadar None kalır
+plt = None
+A4 = SimpleDocTemplate = Paragraph = Spacer = Table = Image = None
+getSampleStyleSheet = HEADER_STYLE = None
+Document = Inches = None
+
+
+def _plt():
+    """matplotlib.pyplot'u ilk çağrıda yükler"""
+    global plt
+    if plt is None:
+        import matplotlib.pyplot
+        plt = matplotlib.pyplot
+    return plt
+
+
+def _load_reportlab():
+    """reportlab'ı ilk PDF raporunda yükler; kurulu değilse False döner"""
+    global A4, SimpleDocTemplate, Paragraph, Spacer, Table, Image
+    global getSampleStyleSheet, HEADER_STYLE
+    if SimpleDocTemplate is not None:
+        return True
+    try:
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.lib import colors
+    except ImportError:  # PDF raporu için reportlab gerekli
+        return False
+
+    # PDF tablolarında ortak stil (her tablo için yeniden kurulmaz)
+    HEADER_STYLE = TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+        ("LEFTPADDING", (0, 0), (-1, -1), 3),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 3)
+    ])
+    return True
+
+
+def _load_docx():
+    """python-docx'i ilk Word raporunda yükler; kurulu değilse False döner"""
+    global Document, Inches
+    if Document is not None:
+        return True
+    try:
+        from docx import Document
+        from docx.shared import Inches
+    except ImportError:  # Word raporu için python-docx gerekli
+        return False
+    return True
 
 
 # ===========================================================
@@ -54,12 +122,19 @@ class ScrollableFrame(ttk.Frame):
 # === 2. BÖLÜM: PFS SINIFI ve DILSEL ÖLÇEK TANIMLARI =========
 # ===========================================================
 
-@dataclass
+# True ise her PFS nesnesi oluşturulurken Pisagor koşulu kontrol edilir;
+# normalde doğrulama GUI girişinde validate_all ile toplu yapılır
+DEBUG_PFS = False
+
+
+@dataclass(slots=True, frozen=True)
 class PFS:
     mu: float
     nu: float
 
     def __post_init__(self):
+        if not DEBUG_PFS:
+            return
         if self.mu**2 + self.nu**2 > 1 + 1e-9:
             raise ValueError("Pythagorean condition violated: mu^2 + nu^2 <= 1")
 
@@ -67,6 +142,21 @@ class PFS:
         return self.mu**2 - self.nu**2
 
 
+# Hesaplamalarda kullanılan iç gösterim: hücre başına PFS nesnesi yerine
+# paralel (mu, nu) float64 dizileri — (n x m) veya uzman bazında (E x n x m)
+PFSBlock = namedtuple("PFSBlock", "mu nu")
+
+
+def validate_all(matrix):
+    """
+    Pisagor koşulunu tüm matris için tek seferde doğrular
+    matrix: PFSBlock veya PFS nesnelerinden oluşan (n x m) liste
+    """
+    mu, nu = _pfs_to_arrays(matrix)
+    if not np.all(mu**2 + nu**2 <= 1 + 1e-9):
+        raise ValueError("Pythagorean condition violated: mu^2 + nu^2 <= 1")
+
+
 # FAHP dilsel ölçek
 AHP_SCALE = {
     "EQ": (0.70, 0.70),
@@ -85,84 +175,219 @@ TOPSIS_SCALE = {
     "VH": (0.90, 0.30)
 }
 
+# Combobox seçenekleri (tüm Combobox'lar aynı demeti paylaşır)
+AHP_KEYS = tuple(AHP_SCALE.keys())
+TOPSIS_KEYS = tuple(TOPSIS_SCALE.keys())
+
+# Ölçeklerin dizi karşılıkları: satır k = k. ifadenin (mu, nu) değeri
+AHP_LOOKUP = np.array(list(AHP_SCALE.values()), dtype=np.float64)
+TOPSIS_LOOKUP = np.array(list(TOPSIS_SCALE.values()), dtype=np.float64)
+
 
 # ===========================================================
 # ======= 3. BÖLÜM: FAHP ve FTOPSIS HESAP FONKSIYONLARI ======
 # ===========================================================
 
-def fahp_weights(pfs_matrix):
+def _pfs_to_arrays(pfs_matrix):
     """
-    pfs_matrix: (5x5) birleşik PFS matrisi (aggregate FAHP)
-    Dönen: 5 elemanlı ağırlık listesi
+    PFS matrisini bir kez (mu, nu) float64 dizilerine ayırır
+    pfs_matrix: PFSBlock veya PFS nesnelerinden oluşan iç içe liste
+    Dönen: (mu, nu) — her biri matris boyutunda np.ndarray
     """
-    n = len(pfs_matrix)
-    S = [[pfs_matrix[i][j].mu for j in range(n)] for i in range(n)]
+    if isinstance(pfs_matrix, PFSBlock):
+        return (np.ascontiguousarray(pfs_matrix.mu, dtype=np.float64),
+                np.ascontiguousarray(pfs_matrix.nu, dtype=np.float64))
+    mu = np.array([[c.mu for c in row] for row in pfs_matrix], dtype=np.float64)
+    nu = np.array([[c.nu for c in row] for row in pfs_matrix], dtype=np.float64)
+    return mu, nu
 
-    g = []
-    for i in range(n):
-        prod = 1.0
-        for j in range(n):
-            prod *= S[i][j]
-        g.append(prod ** (1.0 / n))
 
-    total = sum(g)
-    if total == 0:
-        return [1.0 / n] * n
-    return [gi / total for gi in g]
+def _fahp_core_np(mu_mat):
+    """FAHP çekirdeği (NumPy): satır geometrik ortalamalarından ağırlıklar"""
+    n = mu_mat.shape[0]
+    g = mu_mat.prod(axis=1) ** (1.0 / n)
 
+    total = g.sum()
+    if total == 0:
+        return np.full(n, 1.0 / n)
+    return g / total
 
-def ftopsis(pfs_matrix, weights, alternatives):
-    """
-    pfs_matrix: m x n PFS matrisi (aggregate TOPSIS)
-    weights: n boyutlu ağırlık vektörü
-    alternatives: ['B1', 'B2', ...]
-    Dönen: sıralanmış DataFrame
-    """
-    m = len(pfs_matrix)
-    n = len(pfs_matrix[0])
 
+def _ftopsis_core_np(mu, nu, weights):
+    """FTOPSIS çekirdeği (NumPy): (D+, D-, CC) dizileri"""
     # Skor matrisi
-    S = [[pfs_matrix[i][j].score() for j in range(n)] for i in range(m)]
+    S = mu * mu - nu * nu
 
-    # Normalize
-    R = []
-    for j in range(n):
-        denom = math.sqrt(sum(S[i][j] ** 2 for i in range(m)))
-        if denom == 0:
-            denom = 1.0
-        col = [S[i][j] / denom for i in range(m)]
-        if j == 0:
-            R = [[col[i]] for i in range(m)]
-        else:
-            for i in range(m):
-                R[i].append(col[i])
+    # Normalize (sütun normu, sıfır sütunlar bölünmeden kalır)
+    denom = np.linalg.norm(S, axis=0)
+    denom[denom == 0] = 1.0
+    R = S / denom
 
     # Ağırlıklı normalize matris
-    V = [[R[i][j] * weights[j] for j in range(n)] for i in range(m)]
+    V = R * weights
 
     # Pozitif / negatif ideal
-    v_plus = [max(V[i][j] for i in range(m)) for j in range(n)]
-    v_minus = [min(V[i][j] for i in range(m)) for j in range(n)]
+    v_plus = V.max(axis=0)
+    v_minus = V.min(axis=0)
 
     # Uzaklıklar
-    D_plus, D_minus = [], []
+    D_plus = np.linalg.norm(V - v_plus, axis=1)
+    D_minus = np.linalg.norm(V - v_minus, axis=1)
+
+    total = D_plus + D_minus
+    CC = np.divide(D_minus, total, out=np.zeros_like(total), where=total != 0)
+    return D_plus, D_minus, CC
+
+
+def _fahp_core_loops(mu_mat):
+    """FAHP çekirdeği (numba ile derlenir): satır geometrik ortalamalarından ağırlıklar"""
+    n = mu_mat.shape[0]
+    g = np.empty(n)
+    total = 0.0
+    for i in range(n):
+        prod = 1.0
+        for j in range(n):
+            prod *= mu_mat[i, j]
+        g[i] = prod ** (1.0 / n)
+        total += g[i]
+
+    for i in range(n):
+        g[i] = 1.0 / n if total == 0 else g[i] / total
+    return g
+
+
+def _ftopsis_core_loops(mu, nu, weights):
+    """
+    FTOPSIS çekirdeği (numba ile derlenir): (D+, D-, CC) dizileri
+    Skor, normalize ve ağırlıklı matrisler (m x n) saklanmaz;
+    V[i, j] her geçişte mu/nu üzerinden yeniden üretilir
+    """
+    m, n = mu.shape
+
+    # 1. geçiş: sütun normları
+    denom = np.zeros(n)
+    for i in range(m):
+        for j in range(n):
+            s = mu[i, j] * mu[i, j] - nu[i, j] * nu[i, j]
+            denom[j] += s * s
+    # Normalize ve ağırlık tek katsayıda birleşir: V = S * scale
+    scale = np.empty(n)
+    for j in range(n):
+        d = np.sqrt(denom[j])
+        scale[j] = weights[j] / (d if d != 0 else 1.0)
+
+    # 2. geçiş: pozitif / negatif ideal
+    v_plus = np.empty(n)
+    v_minus = np.empty(n)
     for i in range(m):
-        dp = math.sqrt(sum((V[i][j] - v_plus[j]) ** 2 for j in range(n)))
-        dm = math.sqrt(sum((V[i][j] - v_minus[j]) ** 2 for j in range(n)))
-        D_plus.append(dp)
-        D_minus.append(dm)
+        for j in range(n):
+            v = (mu[i, j] * mu[i, j] - nu[i, j] * nu[i, j]) * scale[j]
+            if i == 0 or v > v_plus[j]:
+                v_plus[j] = v
+            if i == 0 or v < v_minus[j]:
+                v_minus[j] = v
+
+    # 3. geçiş: uzaklıklar ve yakınlık katsayısı
+    D_plus = np.empty(m)
+    D_minus = np.empty(m)
+    CC = np.empty(m)
+    for i in range(m):
+        dp = 0.0
+        dm = 0.0
+        for j in range(n):
+            v = (mu[i, j] * mu[i, j] - nu[i, j] * nu[i, j]) * scale[j]
+            dp += (v - v_plus[j]) ** 2
+            dm += (v - v_minus[j]) ** 2
+        D_plus[i] = np.sqrt(dp)
+        D_minus[i] = np.sqrt(dm)
+        total = D_plus[i] + D_minus[i]
+        CC[i] = D_minus[i] / total if total != 0 else 0.0
+    return D_plus, D_minus, CC
+
+
+# numba derlemesi bitene kadar (veya numba yoksa) NumPy çekirdekleri kullanılır
+_fahp_core = _fahp_core_np
+_ftopsis_core = _ftopsis_core_np
+
+
+def load_jit_kernels():
+    """
+    numba kuruluysa döngü çekirdeklerini derler (önbellek varsa yükler) ve
+    sonraki hesaplamalarda onları kullanır. Derleme maliyeti ilk HESAPLA
+    tıklamasında ödenmesin diye pencere açıldıktan sonra arka planda çağrılır.
+    Dönen: numba çekirdekleri etkinleştiyse True
+    """
+    global _fahp_core, _ftopsis_core
+    try:
+        from numba import njit
+    except ImportError:  # numba kurulu değilse NumPy çekirdekleri kullanılır
+        return False
+
+    # PyInstaller ile dondurulmuş sürümde kaynak dosya olmadığından
+    # numba önbelleği yazılamaz; bu durumda önbellek kapatılır
+    cache = not getattr(sys, "frozen", False)
+    fahp_core = njit(cache=cache)(_fahp_core_loops)
+    ftopsis_core = njit(cache=cache)(_ftopsis_core_loops)
+
+    warmup = np.full((5, 5), 0.5)
+    fahp_core(warmup)
+    ftopsis_core(warmup, warmup, np.full(5, 0.2))
+
+    _fahp_core, _ftopsis_core = fahp_core, ftopsis_core
+    return True
+
+
+@lru_cache(maxsize=32)
+def _fahp_weights_cached(mu_bytes, n):
+    """Aynı mu matrisi için ağırlıkları yeniden hesaplamaz (anahtar: ham baytlar)"""
+    S = np.frombuffer(mu_bytes, dtype=np.float64).reshape(n, n).copy()
+    return tuple(_fahp_core(S).tolist())
+
+
+@lru_cache(maxsize=32)
+def _ftopsis_cached(mu_bytes, nu_bytes, shape, weights):
+    """Aynı girdiler için (D+, D-, CC) dizilerini önbellekten döndürür"""
+    mu = np.frombuffer(mu_bytes, dtype=np.float64).reshape(shape).copy()
+    nu = np.frombuffer(nu_bytes, dtype=np.float64).reshape(shape).copy()
+    result = _ftopsis_core(mu, nu, np.array(weights, dtype=np.float64))
+    # Önbellekteki diziler paylaşıldığı için salt okunur yapılır
+    for arr in result:
+        arr.flags.writeable = False
+    return result
+
+
+def fahp_weights(pfs_matrix):
+    """
+    pfs_matrix: (5x5) birleşik PFS matrisi (PFSBlock veya PFS listesi)
+    Dönen: 5 elemanlı ağırlık listesi
+    """
+    S, _ = _pfs_to_arrays(pfs_matrix)
+    return list(_fahp_weights_cached(S.tobytes(), S.shape[0]))
+
+
+def ftopsis(pfs_matrix, weights, alternatives):
+    """
+    pfs_matrix: m x n PFS matrisi (PFSBlock veya PFS listesi)
+    weights: n boyutlu ağırlık vektörü
+    alternatives: ['B1', 'B2', ...]
+    Dönen: sıralanmış DataFrame
+    """
+    # pandas açılışı yavaşlatmasın diye ilk hesaplamada yüklenir
+    import pandas as pd
 
-    CC = [
-        D_minus[i] / (D_plus[i] + D_minus[i]) if (D_plus[i] + D_minus[i]) != 0 else 0.0
-        for i in range(m)
-    ]
+    mu, nu = _pfs_to_arrays(pfs_matrix)
+    D_plus, D_minus, CC = _ftopsis_cached(
+        mu.tobytes(), nu.tobytes(), mu.shape, tuple(float(w) for w in weights)
+    )
 
+    # CC'ye göre azalan sıra; DataFrame doğrudan son düzeniyle kurulur
+    idx = np.argsort(-CC, kind="stable")
     df = pd.DataFrame({
-        "Alternative": alternatives,
-        "D+": D_plus,
-        "D-": D_minus,
-        "CC": CC
-    }).sort_values(by="CC", ascending=False).reset_index(drop=True)
+        "Alternative": [alternatives[i] for i in idx],
+        "D+": D_plus[idx],
+        "D-": D_minus[idx],
+        "CC": CC[idx]
+    })
 
     return df
 
@@ -171,39 +396,127 @@ def ftopsis(pfs_matrix, weights, alternatives):
 # =============== 8. BÖLÜM: SENARYO YÖNETİMİ ==================
 # ===========================================================
 
+def _write_json(path, data):
+    """JSON dosyası yazar (varsa orjson ile, UTF-8, 2 boşluk girinti)"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def _read_json(path):
+    """JSON dosyası okur (varsa orjson ile)"""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 class ScenarioManager:
-    """Senaryo kaydetme ve karşılaştırması"""
+    """
+    Senaryo kaydetme ve karşılaştırması
+    Her senaryo <ad>.json dosyasında tutulur; ayrıca _index.json kataloğu
+    yalnızca ad → (tarih, ağırlıklar) bilgisini saklar, böylece listeleme ve
+    karşılaştırma tüm senaryo dosyalarını okumadan yapılır.
+    """
+    INDEX_NAME = "_index"
+
     def __init__(self, data_dir="scenarios"):
         self.data_dir = data_dir
         if not os.path.exists(data_dir):
             os.makedirs(data_dir)
     
+    def _index_path(self):
+        return os.path.join(self.data_dir, f"{self.INDEX_NAME}.json")
+
+    def _scan_scenarios(self):
+        with os.scandir(self.data_dir) as it:
+            return [
+                e.name[:-5] for e in it
+                if e.name.endswith(".json") and e.name[:-5] != self.INDEX_NAME and e.is_file()
+            ]
+
+    @staticmethod
+    def _index_entry(data):
+        return {"date": data["date"], "weights": data["weights"]}
+
+    @staticmethod
+    def _is_entry(entry):
+        return isinstance(entry, dict) and "date" in entry and "weights" in entry
+
+    def _read_entry(self, name):
+        """Senaryo dosyasından katalog kaydı; okunamayan/uyumsuz dosyada None"""
+        try:
+            data = self.load_scenario(name)
+        except (OSError, ValueError):
+            return None
+        if not self._is_entry(data):
+            return None
+        return self._index_entry(data)
+
+    def catalog(self):
+        """
+        Senaryo kataloğu: {ad: {"date": ..., "weights": [...]}}
+        Katalog yoksa, bozuksa veya klasördeki dosyalarla uyuşmuyorsa
+        yalnızca eksik senaryolar okunarak güncellenir. Okunamayan veya
+        senaryo olmayan .json dosyaları kataloğa alınmaz.
+        """
+        if not os.path.exists(self.data_dir):
+            return {}
+
+        index = {}
+        if os.path.exists(self._index_path()):
+            try:
+                index = _read_json(self._index_path())
+            except (OSError, ValueError):
+                index = {}
+            if not isinstance(index, dict):
+                index = {}
+
+        catalog = {}
+        for name in self._scan_scenarios():
+            entry = index.get(name)
+            if not self._is_entry(entry):
+                entry = self._read_entry(name)
+            if entry is not None:
+                catalog[name] = entry
+
+        if catalog != index:
+            _write_json(self._index_path(), catalog)
+        return catalog
+
     def save_scenario(self, scenario_name, fahp_data, ftopsis_data, weights, result_df):
+        if scenario_name == self.INDEX_NAME:
+            raise ValueError(f"'{self.INDEX_NAME}' senaryo adı olarak kullanılamaz")
+
         data = {
             "name": scenario_name,
             "date": datetime.now().isoformat(),
             "fahp_ling": fahp_data,
             "ftopsis_ling": ftopsis_data,
             "weights": weights,
-            "results": result_df.to_dict()
+            "results": result_df.to_dict(orient="records")
         }
+        index = self.catalog()
         path = os.path.join(self.data_dir, f"{scenario_name}.json")
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        _write_json(path, data)
+
+        index[scenario_name] = self._index_entry(data)
+        _write_json(self._index_path(), index)
         return path
     
     def load_scenario(self, scenario_name):
         path = os.path.join(self.data_dir, f"{scenario_name}.json")
         if not os.path.exists(path):
             return None
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return _read_json(path)
     
     def list_scenarios(self):
-        if not os.path.exists(self.data_dir):
-            return []
-        files = [f.replace(".json", "") for f in os.listdir(self.data_dir) if f.endswith(".json")]
-        return sorted(files)
+        return sorted(self.catalog())
 
 
 # ===========================================================
@@ -212,17 +525,19 @@ class ScenarioManager:
 
 def statistical_summary(weights, result_df):
     """İstatistiksel özet bilgisi"""
-    cc_values = result_df["CC"].values
+    cc = np.asarray(result_df["CC"].values, dtype=np.float64)
+    w = np.asarray(weights, dtype=np.float64)
+    cc_min, cc_max = cc.min(), cc.max()
     
     summary = {
-        "Ortalama CC": float(cc_values.mean()),
-        "Standart Sapma": float(cc_values.std()),
-        "Min CC": float(cc_values.min()),
-        "Max CC": float(cc_values.max()),
-        "CC Aralığı": float(cc_values.max() - cc_values.min()),
-        "Ağırlık Ortalaması": float(sum(weights) / len(weights)),
-        "Max Ağırlık": float(max(weights)),
-        "Min Ağırlık": float(min(weights))
+        "Ortalama CC": float(cc.mean()),
+        "Standart Sapma": float(cc.std()),
+        "Min CC": float(cc_min),
+        "Max CC": float(cc_max),
+        "CC Aralığı": float(cc_max - cc_min),
+        "Ağırlık Ortalaması": float(w.mean()),
+        "Max Ağırlık": float(w.max()),
+        "Min Ağırlık": float(w.min())
     }
     return summary
 
@@ -232,25 +547,22 @@ def statistical_summary(weights, result_df):
 # ===========================================================
 
 def expert_agreement_analysis(pfs_experts):
-    """Uzmanlar arası uyum analizi"""
-    if not pfs_experts or not pfs_experts[0]:
+    """
+    Uzmanlar arası uyum analizi
+    pfs_experts: PFSBlock(mu, nu) — her biri (E x n x m) — veya
+                 uzman bazında PFS matrislerinin listesi
+    """
+    if isinstance(pfs_experts, PFSBlock):
+        mu, nu = pfs_experts
+    else:
+        # PFS listelerini tek seferde (E x n x m) dizilere yığ
+        mu = np.array([[[c.mu for c in row] for row in e] for e in pfs_experts], dtype=np.float64)
+        nu = np.array([[[c.nu for c in row] for row in e] for e in pfs_experts], dtype=np.float64)
+    if mu.size == 0:
         return {"Ortalama Varyans": 0, "Uyum Skoru": 1, "Uyum Seviyesi": "Yüksek"}
-    
-    n = len(pfs_experts[0])
-    m = len(pfs_experts[0][0])
-    variances = []
-    
-    for i in range(n):
-        for j in range(m):
-            mu_values = [pfs_experts[e][i][j].mu for e in range(len(pfs_experts))]
-            nu_values = [pfs_experts[e][i][j].nu for e in range(len(pfs_experts))]
-            mu_avg = sum(mu_values) / len(mu_values)
-            nu_avg = sum(nu_values) / len(nu_values)
-            var = (sum((mu - mu_avg)**2 for mu in mu_values) / len(mu_values)) + \
-                  (sum((nu - nu_avg)**2 for nu in nu_values) / len(nu_values))
-            variances.append(var)
-    
-    avg_variance = sum(variances) / len(variances) if variances else 0
+
+    var = mu.var(axis=0, ddof=0) + nu.var(axis=0, ddof=0)
+    avg_variance = float(var.mean())
     return {
         "Ortalama Varyans": round(avg_variance, 4),
         "Uyum Skoru": round(1 - min(avg_variance, 1), 4),
@@ -262,13 +574,27 @@ def expert_agreement_analysis(pfs_experts):
 # =============== 11. BÖLÜM: RADAR CHART =====================
 # ===========================================================
 
-def create_radar_chart(criteria, weights):
-    """Kriterler için radar chart"""
-    fig, ax = plt.subplots(figsize=(6, 6), subplot_kw=dict(projection='polar'))
+@lru_cache(maxsize=16)
+def _radar_angles(k):
+    """k kriter için kapalı açı dizisi (ilk açı sonda tekrar eder)"""
+    angles = np.concatenate([np.linspace(0, 2 * np.pi, k, endpoint=False), [0.0]])
+    angles.flags.writeable = False
+    return angles
+
+
+def create_radar_chart(criteria, weights, ax=None):
+    """
+    Kriterler için radar chart
+    ax: verilirse (polar) eksen temizlenip yeniden çizilir, yeni Figure açılmaz
+    """
+    if ax is None:
+        fig, ax = _plt().subplots(figsize=(6, 6), subplot_kw=dict(projection='polar'))
+    else:
+        fig = ax.figure
+        ax.clear()
     
-    angles = [n / float(len(criteria)) * 2 * math.pi for n in range(len(criteria))]
-    weights_plot = list(weights) + [weights[0]]
-    angles += angles[:1]
+    angles = _radar_angles(len(criteria))
+    weights_plot = np.concatenate([weights, weights[:1]])
     
     ax.plot(angles, weights_plot, 'o-', linewidth=2, color="#5680e9")
     ax.fill(angles, weights_plot, alpha=0.25, color="#5680e9")
@@ -285,6 +611,10 @@ def create_radar_chart(criteria, weights):
 # =============== 4. BÖLÜM: ANA GUI SINIFI ===================
 # ===========================================================
 
+# PDF/Word raporları Tk ana döngüsünü dondurmamak için burada oluşturulur
+_REPORT_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+
 class App:
 
     def __init__(self, root):
@@ -298,9 +628,31 @@ class App:
         self.experts = 4
         
         self.scenario_manager = ScenarioManager()
+
+        # Dilsel ifade → tablo indeksi ve (mu, nu) tabloları (hesaplamada kullanılır)
+        self._ahp_label_to_idx = {label: k for k, label in enumerate(AHP_KEYS)}
+        self._ahp_mu = np.ascontiguousarray(AHP_LOOKUP[:, 0])
+        self._ahp_nu = np.ascontiguousarray(AHP_LOOKUP[:, 1])
+        self._topsis_label_to_idx = {label: k for k, label in enumerate(TOPSIS_KEYS)}
+        self._topsis_mu = np.ascontiguousarray(TOPSIS_LOOKUP[:, 0])
+        self._topsis_nu = np.ascontiguousarray(TOPSIS_LOOKUP[:, 1])
+
+        # Senaryo geri yüklemede yazılabilir hücreler (FAHP köşegeni sabit "EQ")
+        self._fahp_settable = [
+            (e, i, j) for e in range(self.experts) for i in range(5) for j in range(5) if i != j
+        ]
+        self._ftopsis_settable = [
+            (e, i, j) for e in range(self.experts) for i in range(5) for j in range(5)
+        ]
         self.last_result = None
         self.current_theme = "light"
 
+        # Grafikler ilk hesaplamada oluşturulur, sonraki hesaplamalarda yeniden kullanılır
+        self._bar_fig = None
+        self._bar_ax = None
+        self._radar_fig = None
+        self._results_win = None
+
         # Header Frame
         header_frame = ttk.Frame(root)
         header_frame.pack(pady=15)
@@ -323,11 +675,23 @@ class App:
         self.tabs = ttk.Notebook(root)
         self.tabs.pack(expand=1, fill="both", padx=20, pady=10)
 
-        self.fahp_frames = []
-        self.ftopsis_frames = []
+        # Girişler: her Combobox'a bağlı StringVar (sekme kurulmasa da okunabilir)
+        self.fahp_vars = []
+        self.ftopsis_vars = []
+
+        # Uzman sekmeleri ilk seçildiklerinde kurulur (açılışta yalnızca ilk sekme)
+        self._tab_builders = []
+        self._built = []
 
         self.create_fahp_tabs()
         self.create_ftopsis_tabs()
+        self.tabs.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._build_tab(0)
+
+        # numba çekirdekleri pencere gösterildikten sonra arka planda derlenir
+        self.root.after_idle(
+            lambda: threading.Thread(target=load_jit_kernels, daemon=True).start()
+        )
 
         ttk.Button(root, text="HESAPLA", command=self.compute, width=20).pack(pady=10)
 
@@ -376,13 +740,17 @@ class App:
                 messagebox.showwarning("Hata", "Senaryo adı boş olamaz")
                 return
             
-            self.scenario_manager.save_scenario(
-                name,
-                self.last_result["fahp_ling"],
-                self.last_result["ftopsis_ling"],
-                self.last_result["weights"],
-                self.last_result["df"]
-            )
+            try:
+                self.scenario_manager.save_scenario(
+                    name,
+                    self.last_result["fahp_ling"],
+                    self.last_result["ftopsis_ling"],
+                    self.last_result["weights"],
+                    self.last_result["df"]
+                )
+            except ValueError as err:
+                messagebox.showwarning("Hata", str(err))
+                return
             messagebox.showinfo("Başarılı", f"Senaryo '{name}' kaydedildi")
             dialog.destroy()
         
@@ -451,8 +819,8 @@ class App:
 
     def compare_scenarios(self):
         """Senaryo karşılaştırması"""
-        scenarios = self.scenario_manager.list_scenarios()
-        if len(scenarios) < 2:
+        catalog = self.scenario_manager.catalog()
+        if len(catalog) < 2:
             messagebox.showinfo("Bilgi", "Karşılaştırma için en az 2 senaryo gerekli")
             return
         
@@ -463,13 +831,17 @@ class App:
         txt = tk.Text(win, font=("Segoe UI", 11))
         txt.pack(fill="both", expand=True, padx=10, pady=10)
         
-        for scenario_name in scenarios:
-            data = self.scenario_manager.load_scenario(scenario_name)
-            txt.insert("end", f"\n{'='*50}\n")
-            txt.insert("end", f"Senaryo: {scenario_name}\n")
-            txt.insert("end", f"Tarih: {data['date']}\n")
-            txt.insert("end", f"Ağırlıklar: {', '.join(f'{w:.4f}' for w in data['weights'])}\n")
-            txt.insert("end", f"{'='*50}\n\n")
+        lines = []
+        for scenario_name in sorted(catalog):
+            data = catalog[scenario_name]
+            lines.append(
+                f"\n{'='*50}\n"
+                f"Senaryo: {scenario_name}\n"
+                f"Tarih: {data['date']}\n"
+                f"Ağırlıklar: {', '.join(f'{w:.4f}' for w in data['weights'])}\n"
+                f"{'='*50}\n\n"
+            )
+        txt.insert("end", "".join(lines))
         
         txt.configure(state="disabled")
 
@@ -479,35 +851,11 @@ class App:
         ftopsis_ling = data["ftopsis_ling"]
         
         try:
-            # FAHP sekmeleri güncelle
-            for e in range(self.experts):
-                for i in range(5):
-                    for j in range(5):
-                        w = self.fahp_frames[e][i][j]
-                        value = fahp_ling[e][i][j]
-                        
-                        # Diagonal: string ("EQ"), değiştirilmez
-                        if isinstance(w, str):
-                            continue
-                        # Combobox widget ise
-                        else:
-                            try:
-                                w.set(value)
-                            except:
-                                pass
-            
-            # FTOPSIS sekmeleri güncelle
-            for e in range(self.experts):
-                for i in range(5):
-                    for j in range(5):
-                        w = self.ftopsis_frames[e][i][j]
-                        value = ftopsis_ling[e][i][j]
-                        
-                        # Combobox widget ise
-                        try:
-                            w.set(value)
-                        except:
-                            pass
+            # Önce tüm değerler okunur: eksik veri varsa hiçbir giriş değişmez
+            updates = [(self.fahp_vars[e][i][j], fahp_ling[e][i][j]) for e, i, j in self._fahp_settable]
+            updates += [(self.ftopsis_vars[e][i][j], ftopsis_ling[e][i][j]) for e, i, j in self._ftopsis_settable]
+            for var, value in updates:
+                var.set(value)
             
             messagebox.showinfo("Başarılı", "Tüm girişler senaryo verileriyle güncellendi!")
         
@@ -564,167 +912,148 @@ class App:
                         )
         ft_table.configure(state="disabled")
 
-    # ------------------ FAHP Sekmeleri ---------------
-    def create_fahp_tabs(self):
-        for e in range(self.experts):
-            outer = ScrollableFrame(self.tabs)
-            frame = outer.scrollable_frame
-            self.tabs.add(outer, text=f"FAHP Uzman {e+1}")
-
-            combos = []
+    # ------------------ Tembel Sekme Kurulumu --------
+    def _add_lazy_tab(self, text, builder, e):
+        outer = ScrollableFrame(self.tabs)
+        ttk.Label(outer.scrollable_frame, text="Yükleniyor...").grid(row=0, column=0, padx=10, pady=10)
+        self.tabs.add(outer, text=text)
+        self._tab_builders.append((builder, e, outer))
+        self._built.append(False)
 
-            ttk.Label(frame, text="", width=10).grid(row=0, column=0)
-            for j, crit in enumerate(self.criteria):
-                ttk.Label(frame, text=crit, font=("Segoe UI", 10, "bold")).grid(row=0, column=j+1, pady=8)
+    def _on_tab_changed(self, event):
+        self._build_tab(self.tabs.index(self.tabs.select()))
 
-            for i in range(5):
-                row = []
-                ttk.Label(frame, text=self.criteria[i]).grid(row=i+1, column=0)
-
-                for j in range(5):
-                    if i == j:
-                        lbl = ttk.Label(frame, text="EQ")
-                        lbl.grid(row=i+1, column=j+1)
-                        row.append("EQ")  # direkt string
-                    else:
-                        cb = ttk.Combobox(
-                            frame,
-                            values=list(AHP_SCALE.keys()),
-                            width=7,
-                            state="readonly"
-                        )
-                        cb.set("EQ")
-                        cb.grid(row=i+1, column=j+1, padx=5, pady=4)
-                        row.append(cb)
-                combos.append(row)
-
-            self.fahp_frames.append(combos)
+    def _build_tab(self, idx):
+        if idx >= len(self._built) or self._built[idx]:
+            return
+        builder, e, outer = self._tab_builders[idx]
+        for child in outer.scrollable_frame.winfo_children():
+            child.destroy()
+        builder(e, outer.scrollable_frame)
+        self._built[idx] = True
 
-    # ------------------ FTOPSIS Sekmeleri ------------
-    def create_ftopsis_tabs(self):
+    # ------------------ FAHP Sekmeleri ---------------
+    def create_fahp_tabs(self):
         for e in range(self.experts):
-            outer = ScrollableFrame(self.tabs)
-            frame = outer.scrollable_frame
-            self.tabs.add(outer, text=f"FTOPSIS Uzman {e+1}")
-
-            combos = []
+            self._add_lazy_tab(f"FAHP Uzman {e+1}", self._build_fahp_tab, e)
+            self.fahp_vars.append([
+                ["EQ" if i == j else tk.StringVar(self.root, value="EQ") for j in range(5)]
+                for i in range(5)
+            ])
 
-            ttk.Label(frame, text="", width=10).grid(row=0, column=0)
-            for j, crit in enumerate(self.criteria):
-                ttk.Label(frame, text=crit, font=("Segoe UI", 10, "bold")).grid(row=0, column=j+1, pady=8)
+    def _build_fahp_tab(self, e, frame):
+        ttk.Label(frame, text="", width=10).grid(row=0, column=0)
+        for j, crit in enumerate(self.criteria):
+            ttk.Label(frame, text=crit, font=("Segoe UI", 10, "bold")).grid(row=0, column=j+1, pady=8)
 
-            for i in range(5):
-                row = []
-                ttk.Label(frame, text=self.alternatives[i]).grid(row=i+1, column=0)
+        for i in range(5):
+            ttk.Label(frame, text=self.criteria[i]).grid(row=i+1, column=0)
 
-                for j in range(5):
+            for j in range(5):
+                if i == j:
+                    ttk.Label(frame, text="EQ").grid(row=i+1, column=j+1)
+                else:
                     cb = ttk.Combobox(
                         frame,
-                        values=list(TOPSIS_SCALE.keys()),
+                        values=AHP_KEYS,
+                        textvariable=self.fahp_vars[e][i][j],
                         width=7,
                         state="readonly"
                     )
-                    cb.set("M")
                     cb.grid(row=i+1, column=j+1, padx=5, pady=4)
-                    row.append(cb)
-                combos.append(row)
 
-            self.ftopsis_frames.append(combos)
+    # ------------------ FTOPSIS Sekmeleri ------------
+    def create_ftopsis_tabs(self):
+        for e in range(self.experts):
+            self._add_lazy_tab(f"FTOPSIS Uzman {e+1}", self._build_ftopsis_tab, e)
+            self.ftopsis_vars.append([
+                [tk.StringVar(self.root, value="M") for j in range(5)]
+                for i in range(5)
+            ])
+
+    def _build_ftopsis_tab(self, e, frame):
+        ttk.Label(frame, text="", width=10).grid(row=0, column=0)
+        for j, crit in enumerate(self.criteria):
+            ttk.Label(frame, text=crit, font=("Segoe UI", 10, "bold")).grid(row=0, column=j+1, pady=8)
+
+        for i in range(5):
+            ttk.Label(frame, text=self.alternatives[i]).grid(row=i+1, column=0)
+
+            for j in range(5):
+                cb = ttk.Combobox(
+                    frame,
+                    values=TOPSIS_KEYS,
+                    textvariable=self.ftopsis_vars[e][i][j],
+                    width=7,
+                    state="readonly"
+                )
+                cb.grid(row=i+1, column=j+1, padx=5, pady=4)
 
     # =================================================
     # 5. BÖLÜM: HESAPLAMA & SONUÇ PENCERESİ
     # =================================================
     def compute(self):
+        # matplotlib ana pencere açıldıktan sonra, ilk hesaplamada yüklenir
+        plt = _plt()
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         # -----------------------------
-        # FAHP – 4 uzman dilsel matris
+        # FAHP – 4 uzman dilsel matris → PFS (tek geçiş)
         # -----------------------------
-        fahp_ling_experts = []
+        ahp_idx = self._ahp_label_to_idx
+        fahp_labels = np.empty((self.experts, 5, 5), dtype=object)
+        idx = np.empty((self.experts, 5, 5), dtype=np.intp)
         for e in range(self.experts):
-            ling_matrix = []
             for i in range(5):
-                row_labels = []
                 for j in range(5):
-                    if i == j:
-                        label = "EQ"
-                    else:
-                        w = self.fahp_frames[e][i][j]
-                        label = w if isinstance(w, str) else w.get()
-                    row_labels.append(label)
-                ling_matrix.append(row_labels)
-            fahp_ling_experts.append(ling_matrix)
-
-        # Dilsel → PFS (uzman bazında)
-        fahp_pfs_experts = []
-        for exp in fahp_ling_experts:
-            matrix = []
-            for i in range(5):
-                row = []
-                for j in range(5):
-                    mu, nu = AHP_SCALE[exp[i][j]]
-                    row.append(PFS(mu, nu))
-                matrix.append(row)
-            fahp_pfs_experts.append(matrix)
+                    label = "EQ" if i == j else self.fahp_vars[e][i][j].get()
+                    fahp_labels[e, i, j] = label
+                    idx[e, i, j] = ahp_idx[label]
+        fahp_ling_experts = fahp_labels.tolist()
+
+        # Uzman bazında PFS (E x 5 x 5)
+        fahp_pfs_experts = PFSBlock(self._ahp_mu[idx], self._ahp_nu[idx])
+        validate_all(fahp_pfs_experts)
 
         # Uzmanları birleştir (ortalama mu, nu)
-        pfs_fahp = []
-        for i in range(5):
-            row = []
-            for j in range(5):
-                mu_avg = sum(fahp_pfs_experts[e][i][j].mu for e in range(self.experts)) / self.experts
-                nu_avg = sum(fahp_pfs_experts[e][i][j].nu for e in range(self.experts)) / self.experts
-                row.append(PFS(mu_avg, nu_avg))
-            pfs_fahp.append(row)
+        pfs_fahp = PFSBlock(fahp_pfs_experts.mu.mean(axis=0), fahp_pfs_experts.nu.mean(axis=0))
 
         # FAHP ağırlıkları
         weights = fahp_weights(pfs_fahp)
 
         # -----------------------------
-        # FTOPSIS – 4 uzman dilsel matris
+        # FTOPSIS – 4 uzman dilsel matris → PFS (tek geçiş)
         # -----------------------------
-        ftopsis_ling_experts = []
+        topsis_idx = self._topsis_label_to_idx
+        ftopsis_labels = np.empty((self.experts, 5, 5), dtype=object)
+        idx = np.empty((self.experts, 5, 5), dtype=np.intp)
         for e in range(self.experts):
-            ling_matrix = []
-            for i in range(5):
-                row_labels = []
-                for j in range(5):
-                    w = self.ftopsis_frames[e][i][j]
-                    label = w.get()
-                    row_labels.append(label)
-                ling_matrix.append(row_labels)
-            ftopsis_ling_experts.append(ling_matrix)
-
-        # Dilsel → PFS (uzman bazında)
-        ftopsis_pfs_experts = []
-        for exp in ftopsis_ling_experts:
-            matrix = []
             for i in range(5):
-                row = []
                 for j in range(5):
-                    mu, nu = TOPSIS_SCALE[exp[i][j]]
-                    row.append(PFS(mu, nu))
-                matrix.append(row)
-            ftopsis_pfs_experts.append(matrix)
+                    label = self.ftopsis_vars[e][i][j].get()
+                    ftopsis_labels[e, i, j] = label
+                    idx[e, i, j] = topsis_idx[label]
+        ftopsis_ling_experts = ftopsis_labels.tolist()
+
+        # Uzman bazında PFS (E x 5 x 5)
+        ftopsis_pfs_experts = PFSBlock(self._topsis_mu[idx], self._topsis_nu[idx])
+        validate_all(ftopsis_pfs_experts)
 
         # Uzmanları birleştir (ortalama mu, nu)
-        pfs_top = []
-        for i in range(5):
-            row = []
-            for j in range(5):
-                mu_avg = sum(ftopsis_pfs_experts[e][i][j].mu for e in range(self.experts)) / self.experts
-                nu_avg = sum(ftopsis_pfs_experts[e][i][j].nu for e in range(self.experts)) / self.experts
-                row.append(PFS(mu_avg, nu_avg))
-            pfs_top.append(row)
+        pfs_top = PFSBlock(ftopsis_pfs_experts.mu.mean(axis=0), ftopsis_pfs_experts.nu.mean(axis=0))
 
         # FTOPSIS sonuçları
         result_df = ftopsis(pfs_top, weights, self.alternatives)
 
         # Grafik kaydet
-        fig, ax = plt.subplots(figsize=(6, 4), dpi=100)
+        if self._bar_fig is None:
+            self._bar_fig, self._bar_ax = plt.subplots(figsize=(6, 4), dpi=100)
+        fig, ax = self._bar_fig, self._bar_ax
+        ax.clear()
         ax.bar(result_df["Alternative"], result_df["CC"], color="#5680e9")
         ax.set_title("FTOPSIS Yakınlık Katsayıları (CC)")
         ax.set_ylabel("CC Değeri")
         fig.tight_layout()
-        fig.savefig("ftopsis_grafik.png")
 
         # Son sonuçları kaydet
         self.last_result = {
@@ -741,13 +1070,20 @@ class App:
         expert_agreement = expert_agreement_analysis(fahp_pfs_experts)
         
         # Radar chart
-        radar_fig = create_radar_chart(self.criteria, weights)
-
-        # Sonuç Penceresi
-        win = tk.Toplevel(self.root)
-        win.title("Sonuçlar")
-        win.geometry("1000x850")
-        win.configure(bg="#f2f2f2")
+        radar_ax = self._radar_fig.axes[0] if self._radar_fig is not None else None
+        self._radar_fig = radar_fig = create_radar_chart(self.criteria, weights, ax=radar_ax)
+
+        # Sonuç Penceresi (tek pencere; yeniden hesaplamada içeriği yenilenir)
+        win = self._results_win
+        if win is not None and win.winfo_exists():
+            for child in win.winfo_children():
+                child.destroy()
+            win.lift()
+        else:
+            win = self._results_win = tk.Toplevel(self.root)
+            win.title("Sonuçlar")
+            win.geometry("1000x850")
+            win.configure(bg="#f2f2f2")
 
         tabs = ttk.Notebook(win)
         tabs.pack(expand=1, fill="both", padx=10, pady=10)
@@ -764,19 +1100,17 @@ class App:
         tree.pack(fill="both", expand=True, padx=10, pady=10)
 
         max_w = max(weights)
-        pastel_green = "#d4f8d4"
-        pastel_yellow = "#fff7c2"
-        pastel_pink = "#ffd6e0"
+        tree.tag_configure("green", background="#d4f8d4", foreground="black")
+        tree.tag_configure("yellow", background="#fff7c2", foreground="black")
+        tree.tag_configure("pink", background="#ffd6e0", foreground="black")
 
         for i, w in enumerate(weights, 1):
-            tag = f"w{i}"
             if w >= max_w * 0.85:
-                color = pastel_green
+                tag = "green"
             elif w >= max_w * 0.60:
-                color = pastel_yellow
+                tag = "yellow"
             else:
-                color = pastel_pink
-            tree.tag_configure(tag, background=color, foreground="black")
+                tag = "pink"
             tree.insert("", "end", values=(f"A{i}", f"{w:.4f}"), tags=(tag,))
 
         # TAB 2 – FTOPSIS Grafik
@@ -818,7 +1152,7 @@ class App:
 
         txt = tk.Text(tab5, font=("Segoe UI", 12))
         txt.pack(expand=True, fill="both")
-        txt.insert("end", str(result_df))
+        txt.insert("end", result_df.to_string(index=False, float_format=lambda x: f"{x:.4f}"))
         txt.configure(state="disabled")
 
         # PDF / Word butonları
@@ -847,29 +1181,108 @@ class App:
     # 6. BÖLÜM: KAYDETME KONUMU & PDF/WORD RAPORLARI
     # =================================================
     def ask_pdf_path(self, weights, df, fahp_ling_experts, pfs_fahp, ftopsis_ling_experts, pfs_top):
+        if not _load_reportlab():
+            messagebox.showerror("PDF", "PDF raporu için 'reportlab' paketi kurulu olmalı")
+            return
         file_path = filedialog.asksaveasfilename(
             defaultextension=".pdf",
             filetypes=[("PDF Dosyası", "*.pdf")],
             title="PDF Kaydetme Konumu Seç"
         )
         if file_path:
-            self.create_pdf(file_path, weights, df, fahp_ling_experts, pfs_fahp, ftopsis_ling_experts, pfs_top)
+            chart_png = self.save_chart_png()
+            self.run_report(
+                "PDF", f"PDF raporu oluşturuldu:\n{file_path}",
+                self.create_pdf, file_path, chart_png, weights, df, fahp_ling_experts, pfs_fahp, ftopsis_ling_experts, pfs_top,
+                temp_files=(chart_png,)
+            )
 
     def ask_word_path(self, weights, df, fahp_ling_experts, pfs_fahp, ftopsis_ling_experts, pfs_top):
+        if not _load_docx():
+            messagebox.showerror("WORD", "Word raporu için 'python-docx' paketi kurulu olmalı")
+            return
         file_path = filedialog.asksaveasfilename(
             defaultextension=".docx",
             filetypes=[("Word Dosyası", "*.docx")],
             title="Word Kaydetme Konumu Seç"
         )
         if file_path:
-            self.create_word(file_path, weights, df, fahp_ling_experts, pfs_fahp, ftopsis_ling_experts, pfs_top)
+            chart_png = self.save_chart_png()
+            self.run_report(
+                "WORD", f"Word raporu oluşturuldu:\n{file_path}",
+                self.create_word, file_path, chart_png, weights, df, fahp_ling_experts, pfs_fahp, ftopsis_ling_experts, pfs_top,
+                temp_files=(chart_png,)
+            )
 
-    def create_pdf(self, path, weights, df, fahp_ling_experts, pfs_fahp, ftopsis_ling_experts, pfs_top):
-        from reportlab.lib.pagesizes import A4
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Image
-        from reportlab.lib.styles import getSampleStyleSheet
-        from reportlab.lib import colors
+    def save_chart_png(self):
+        """
+        FTOPSIS grafiğini rapor için geçici bir PNG dosyasına yazar.
+        Grafik yalnızca rapor istendiğinde ve ana iş parçacığında diske yazılır.
+        """
+        tmp = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
+        tmp.close()
+        # Gömülü figür pencere boyutuna göre yeniden boyutlanır; rapora her
+        # zaman 6x4 inç (600x400) kaydedilip eski boyut geri yüklenir
+        fig = self._bar_fig
+        old_size = fig.get_size_inches()
+        fig.set_size_inches(6, 4, forward=False)
+        try:
+            fig.savefig(tmp.name, dpi=100)
+        finally:
+            fig.set_size_inches(old_size, forward=False)
+            fig.canvas.draw_idle()
+        return tmp.name
+
+    def run_report(self, title, done_message, builder, *args, temp_files=()):
+        """
+        Raporu arka plan iş parçacığında oluşturur, bu sırada ilerleme
+        penceresi gösterir. Tk çağrıları yalnızca ana iş parçacığında yapılır:
+        sonuç root.after ile yoklanır ve mesaj kutusu oradan açılır.
+        temp_files: rapor bittikten sonra (hata olsa da) silinecek dosyalar
+        """
+        progress_win = tk.Toplevel(self.root)
+        progress_win.title(title)
+        progress_win.geometry("320x90")
+        progress_win.transient(self.root)
+        progress_win.grab_set()
+        # Rapor bitene kadar pencere kapatılamaz (sonuç mesajı kaybolmasın)
+        progress_win.protocol("WM_DELETE_WINDOW", lambda: None)
+
+        ttk.Label(progress_win, text="Rapor oluşturuluyor...").pack(pady=10)
+        bar = ttk.Progressbar(progress_win, mode="indeterminate", length=260)
+        bar.pack(pady=5)
+        bar.start(10)
+
+        def job():
+            try:
+                builder(*args)
+            finally:
+                for tmp_path in temp_files:
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+
+        future = _REPORT_EXECUTOR.submit(job)
+
+        def poll():
+            if not future.done():
+                self.root.after(100, poll)
+                return
+            if progress_win.winfo_exists():
+                bar.stop()
+                progress_win.grab_release()
+                progress_win.destroy()
+            err = future.exception()
+            if err is not None:
+                messagebox.showerror(title, f"Rapor oluşturulurken hata:\n{err}")
+            else:
+                messagebox.showinfo(title, done_message)
+
+        self.root.after(100, poll)
 
+    def create_pdf(self, path, chart_png, weights, df, fahp_ling_experts, pfs_fahp, ftopsis_ling_experts, pfs_top):
+        # Arka plan iş parçacığında çalışır: Tk nesnelerine dokunmaz
         doc = SimpleDocTemplate(path, pagesize=A4)
         styles = getSampleStyleSheet()
         story = []
@@ -890,75 +1303,72 @@ class App:
         # FAHP – Uzman matrisleri
         story.append(Paragraph("<b>FAHP Uzman İkili Karşılaştırma Matrisleri</b>", styles["Heading2"]))
         for idx, exp in enumerate(fahp_ling_experts, 1):
-            story.append(Paragraph(f"<b>Uzman {idx}</b>", styles["Heading3"]))
             data = [[""] + self.criteria]
-            for i in range(5):
-                row = [self.criteria[i]]
-                for j in range(5):
-                    row.append(exp[i][j])
-                data.append(row)
-            table = Table(data)
-            table.setStyle([("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey)])
-            story.append(table)
-            story.append(Spacer(1, 10))
+            data.extend([self.criteria[i]] + list(exp[i]) for i in range(5))
+            story.extend([
+                Paragraph(f"<b>Uzman {idx}</b>", styles["Heading3"]),
+                Table(data, colWidths=LING_COL_WIDTHS, style=HEADER_STYLE),
+                Spacer(1, 10)
+            ])
 
         # FAHP – Aggregate PFS
-        story.append(Paragraph("<b>FAHP Birleşik (Aggregate) PFS Matrisi</b>", styles["Heading2"]))
         data = [[""] + self.criteria]
-        for i in range(5):
-            row = [self.criteria[i]]
-            for j in range(5):
-                row.append(f"μ={pfs_fahp[i][j].mu:.3f}, ν={pfs_fahp[i][j].nu:.3f}")
-            data.append(row)
-        table = Table(data)
-        story.append(table)
-        story.append(Spacer(1, 15))
+        data.extend(
+            [self.criteria[i]] + [f"μ={pfs_fahp.mu[i, j]:.3f}, ν={pfs_fahp.nu[i, j]:.3f}" for j in range(5)]
+            for i in range(5)
+        )
+        story.extend([
+            Paragraph("<b>FAHP Birleşik (Aggregate) PFS Matrisi</b>", styles["Heading2"]),
+            Table(data, colWidths=PFS_COL_WIDTHS, style=HEADER_STYLE),
+            Spacer(1, 15)
+        ])
 
         # FAHP – Ağırlıklar
-        story.append(Paragraph("<b>FAHP Kriter Ağırlıkları</b>", styles["Heading2"]))
         data = [["Kriter", "Ağırlık"]] + [[f"A{i+1}", f"{w:.4f}"] for i, w in enumerate(weights)]
-        table = Table(data)
-        table.setStyle([("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey)])
-        story.append(table)
-        story.append(Spacer(1, 20))
+        story.extend([
+            Paragraph("<b>FAHP Kriter Ağırlıkları</b>", styles["Heading2"]),
+            Table(data, colWidths=WEIGHT_COL_WIDTHS, style=HEADER_STYLE),
+            Spacer(1, 20)
+        ])
 
         # FTOPSIS – Uzman matrisleri
         story.append(Paragraph("<b>FTOPSIS Uzman Değerlendirme Matrisleri</b>", styles["Heading2"]))
         for idx, exp in enumerate(ftopsis_ling_experts, 1):
-            story.append(Paragraph(f"<b>Uzman {idx}</b>", styles["Heading3"]))
             data = [[""] + self.criteria]
-            for i in range(5):
-                row = [self.alternatives[i]]
-                for j in range(5):
-                    row.append(exp[i][j])
-                data.append(row)
-            table = Table(data)
-            story.append(table)
-            story.append(Spacer(1, 10))
+            data.extend([self.alternatives[i]] + list(exp[i]) for i in range(5))
+            story.extend([
+                Paragraph(f"<b>Uzman {idx}</b>", styles["Heading3"]),
+                Table(data, colWidths=LING_COL_WIDTHS, style=HEADER_STYLE),
+                Spacer(1, 10)
+            ])
 
         # FTOPSIS – Aggregate PFS
-        story.append(Paragraph("<b>FTOPSIS Birleşik (Aggregate) PFS Matrisi</b>", styles["Heading2"]))
         data = [[""] + self.criteria]
-        for i in range(5):
-            row = [self.alternatives[i]]
-            for j in range(5):
-                row.append(f"μ={pfs_top[i][j].mu:.3f}, ν={pfs_top[i][j].nu:.3f}")
-            data.append(row)
-        table = Table(data)
-        story.append(table)
-        story.append(Spacer(1, 15))
+        data.extend(
+            [self.alternatives[i]] + [f"μ={pfs_top.mu[i, j]:.3f}, ν={pfs_top.nu[i, j]:.3f}" for j in range(5)]
+            for i in range(5)
+        )
+        story.extend([
+            Paragraph("<b>FTOPSIS Birleşik (Aggregate) PFS Matrisi</b>", styles["Heading2"]),
+            Table(data, colWidths=PFS_COL_WIDTHS, style=HEADER_STYLE),
+            Spacer(1, 15)
+        ])
 
         # FTOPSIS – Sonuç tablosu
-        story.append(Paragraph("<b>FTOPSIS Sonuç Tablosu</b>", styles["Heading2"]))
-        data2 = [df.columns.tolist()] + df.values.tolist()
-        table2 = Table(data2)
-        table2.setStyle([("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey)])
-        story.append(table2)
-        story.append(Spacer(1, 15))
+        # D+/D-/CC sabit hassasiyetle yazılır ki sütun genişlikleri sabit kalsın
+        data2 = [df.columns.tolist()] + [
+            [alt, f"{dp:.4f}", f"{dm:.4f}", f"{cc:.4f}"]
+            for alt, dp, dm, cc in df.itertuples(index=False)
+        ]
+        story.extend([
+            Paragraph("<b>FTOPSIS Sonuç Tablosu</b>", styles["Heading2"]),
+            Table(data2, colWidths=RESULT_COL_WIDTHS, style=HEADER_STYLE),
+            Spacer(1, 15)
+        ])
 
         # Grafik
         story.append(Paragraph("<b>FTOPSIS Grafiği</b>", styles["Heading2"]))
-        story.append(Image("ftopsis_grafik.png", width=400, height=300))
+        story.append(Image(chart_png, width=400, height=300))
         story.append(Spacer(1, 15))
 
         # Özet sonuç
@@ -970,12 +1380,9 @@ class App:
         ))
 
         doc.build(story)
-        messagebox.showinfo("PDF", f"PDF raporu oluşturuldu:\n{path}")
-
-    def create_word(self, path, weights, df, fahp_ling_experts, pfs_fahp, ftopsis_ling_experts, pfs_top):
-        from docx import Document
-        from docx.shared import Inches
 
+    def create_word(self, path, chart_png, weights, df, fahp_ling_experts, pfs_fahp, ftopsis_ling_experts, pfs_top):
+        # Arka plan iş parçacığında çalışır: Tk nesnelerine dokunmaz
         doc = Document()
         doc.add_heading("PFS–FAHP & PFS–FTOPSIS Raporu", 0)
 
@@ -1011,7 +1418,7 @@ class App:
             row_cells = table.add_row().cells
             row_cells[0].text = self.criteria[r]
             for c in range(5):
-                row_cells[c+1].text = f"μ={pfs_fahp[r][c].mu:.3f}, ν={pfs_fahp[r][c].nu:.3f}"
+                row_cells[c+1].text = f"μ={pfs_fahp.mu[r, c]:.3f}, ν={pfs_fahp.nu[r, c]:.3f}"
 
         # FAHP – Ağırlıklar
         doc.add_heading("FAHP Ağırlıkları", level=1)
@@ -1050,7 +1457,7 @@ class App:
             row = table.add_row().cells
             row[0].text = self.alternatives[r]
             for c in range(5):
-                row[c+1].text = f"μ={pfs_top[r][c].mu:.3f}, ν={pfs_top[r][c].nu:.3f}"
+                row[c+1].text = f"μ={pfs_top.mu[r, c]:.3f}, ν={pfs_top.nu[r, c]:.3f}"
 
         # FTOPSIS – Sonuç Tablosu
         doc.add_heading("FTOPSIS Sonuç Tablosu", level=1)
@@ -1058,14 +1465,14 @@ class App:
         hdr = table.rows[0].cells
         for i, col in enumerate(df.columns):
             hdr[i].text = col
-        for _, row_series in df.iterrows():
+        for values in df.itertuples(index=False, name=None):
             row = table.add_row().cells
-            for i, val in enumerate(row_series):
+            for i, val in enumerate(values):
                 row[i].text = str(val)
 
         # Grafik
         doc.add_heading("FTOPSIS Grafiği", level=1)
-        doc.add_picture("ftopsis_grafik.png", width=Inches(5))
+        doc.add_picture(chart_png, width=Inches(5))
 
         # Özet Sonuç
         best_alt = df.iloc[0]["Alternative"]
@@ -1074,7 +1481,6 @@ class App:
         doc.add_paragraph(f"En iyi alternatif: {best_alt} (CC = {best_cc:.4f})")
 
         doc.save(path)
-        messagebox.showinfo("WORD", f"Word raporu oluşturuldu:\n{path}")
 
 
 # ===========================================================